@@ -59,12 +59,13 @@ class ReviewerAgent(Agent):
         self.name = name
         self.name_slug = sanitize_name(name)
         self.github_repo = github_repo
-        self.clone_path = str(Path(clone_path).resolve())  # Always use absolute path
+        resolved_clone = Path(clone_path).resolve()  # Always use absolute path
+        self.clone_path = str(resolved_clone)
         self.project = project
         self.epic = epic
 
         # Determine working directory (only set if path exists)
-        cwd = self.clone_path if Path(self.clone_path).exists() else None
+        cwd = self.clone_path if resolved_clone.exists() else None
 
         # Create MCP orchestrator server
         orchestrator = create_orchestrator_server(
@@ -51,6 +51,7 @@ class InteractiveInput:
         on_input: Callable[[str], None],
         prompt: str = "> ",
         multiline: bool = True,
+        on_interrupt: Callable[[], None] | None = None,
     ):
         """Initialize the interactive input handler.
 
@@ -61,8 +62,13 @@ class InteractiveInput:
             multiline: Enable multi-line input mode. When True, users can
                 enter multiple lines before submitting. Enter submits,
                 Shift+Enter/Esc+Enter/Alt+Enter insert newlines.
+            on_interrupt: Callback called when Ctrl+C is pressed at the
+                prompt. The terminal is in raw mode while prompting, so
+                Ctrl+C arrives as a key press rather than SIGINT. If None,
+                Ctrl+C raises KeyboardInterrupt from run().
         """
         self._on_input = on_input
+        self._on_interrupt = on_interrupt
         self._prompt = prompt
         self._multiline = multiline
         self._session: PromptSession[str] | None = None
@@ -122,13 +128,22 @@ class InteractiveInput:
         return FormattedText(parts)
 
     def _create_key_bindings(self) -> KeyBindings:
-        """Create custom key bindings for multiline input.
+        """Create custom key bindings for interrupts and multiline input.
 
         Returns:
-            KeyBindings configured based on multiline settings.
+            KeyBindings configured based on the callbacks and multiline
+            settings.
         """
         bindings = KeyBindings()
 
+        if self._on_interrupt is not None:
+            on_interrupt = self._on_interrupt
+
+            # Ctrl+C - hand it to the owner instead of raising
+            @bindings.add(Keys.ControlC)
+            def _ctrl_c_interrupt(event: Any) -> None:
+                on_interrupt()
+
         if not self._multiline:
             # Single-line mode: default behavior (Enter submits)
             return bindings
@@ -193,8 +208,12 @@ class InteractiveInput:
                 if not self._running:
                     break
 
-                # Read input asynchronously
-                user_input = await self._session.prompt_async(self._get_prompt)
+                # Read input asynchronously. SIGINT is left to the owner's
+                # event-loop handler; Ctrl+C typed at the prompt goes to
+                # on_interrupt, if set.
+                user_input = await self._session.prompt_async(
+                    self._get_prompt, handle_sigint=False
+                )
 
                 if user_input and user_input.strip():
                     self._on_input(user_input.strip())
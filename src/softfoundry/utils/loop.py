@@ -9,20 +9,22 @@ Subclasses implement agent-specific logic via abstract methods.
 """
 
 import asyncio
+import atexit
+import contextlib
+import functools
+import re
+import signal
 import sys
+import threading
 import time
+import weakref
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
 from pathlib import Path
-from typing import Any, Literal
-
-from claude_agent_sdk import (
-    AssistantMessage,
-    ClaudeAgentOptions,
-    ClaudeSDKClient,
-    ResultMessage,
-    TextBlock,
-)
-from pydantic import BaseModel, Field
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, TypeVar
+
+from prompt_toolkit import PromptSession
+from pydantic import BaseModel, ConfigDict, Field
 
 from softfoundry.utils.env import get_claude_code_token
 from softfoundry.utils.interactive import InteractiveInput
@@ -31,9 +33,55 @@ from softfoundry.utils.output import MessagePrinter, create_printer
 from softfoundry.utils.sessions import SessionManager, format_session_info
 from softfoundry.utils.status import get_status_path, read_status, update_status
 
+# The SDK is imported lazily so importing this module (e.g., to build an
+# AgentConfig) doesn't pay for loading the SDK and its dependencies.
+if TYPE_CHECKING:
+    from claude_agent_sdk import (
+        AssistantMessage,
+        ClaudeSDKClient,
+        ResultMessage,
+    )
+
 # Heartbeat interval for status file updates (seconds)
 HEARTBEAT_INTERVAL = 60
 
+# Trailing window of assistant text kept for needs_user_input() (characters)
+MAX_ASSISTANT_TEXT_CHARS = 4096
+
+# Minimum time between non-final status file writes (seconds)
+STATUS_DEBOUNCE_INTERVAL = 0.25
+
+T = TypeVar("T")
+
+# Phrases that may request user input even when the text has no "?"
+INPUT_REQUEST_HINTS = (
+    "please provide",
+    "please tell",
+    "please confirm",
+    "let me know",
+    "which",
+    "should i",
+    "would you",
+    "do you",
+    "confirm",
+    "clarify",
+    "choose",
+    "pick",
+)
+
+# Unambiguous requests for input in the final sentence: the text ends with a
+# question mark, or its last sentence asks to provide, confirm, or clarify.
+# Each alternative is anchored to the end of the text and can't cross a
+# sentence end or line break, so a question earlier on doesn't count.
+QUESTION_RE = re.compile(
+    r"(?:\?\s*\Z)"
+    r"|(?:\bplease (?:provide|confirm|clarify)\b[^.!?\n]*[.!:]?\s*\Z)",
+    re.IGNORECASE,
+)
+
+# How much of the end of the text QUESTION_RE is matched against (characters)
+QUESTION_SCAN_CHARS = 1024
+
 
 class TurnResult(BaseModel):
     """Result of processing one agent turn.
@@ -47,7 +95,7 @@ class TurnResult(BaseModel):
     was_interrupted: bool = False
 
 
-def extract_assistant_text(message: AssistantMessage) -> str:
+def extract_assistant_text(message: "AssistantMessage") -> str:
     """Extract text content from an AssistantMessage.
 
     Args:
@@ -56,16 +104,50 @@ def extract_assistant_text(message: AssistantMessage) -> str:
     Returns:
         Concatenated text from all TextBlocks in the message.
     """
-    texts = []
-    for block in message.content:
-        if isinstance(block, TextBlock):
-            texts.append(block.text)
-    return "\n".join(texts)
+    from claude_agent_sdk import TextBlock
+
+    content = message.content
+    # Common case: a single text block needs no join
+    if len(content) == 1 and type(content[0]) is TextBlock:
+        return content[0].text
+    return "\n".join(block.text for block in content if type(block) is TextBlock)
+
+
+def may_need_user_input(text: str) -> bool:
+    """Cheaply check whether text could possibly be asking for user input.
+
+    Args:
+        text: The text to check (typically the last assistant message).
+
+    Returns:
+        False if the text contains no question mark and none of the
+        INPUT_REQUEST_HINTS, True otherwise (the LLM should decide).
+    """
+    if "?" in text:
+        return True
+    lowered = text.lower()
+    return any(hint in lowered for hint in INPUT_REQUEST_HINTS)
+
+
+def _flush_status_at_exit(flush: "weakref.WeakMethod[Callable[[], None]]") -> None:
+    """Call an agent's status flush at interpreter exit, if it's still alive."""
+    method = flush()
+    if method is not None:
+        method()
+
+
+@functools.lru_cache(maxsize=512)
+def _needs_user_input_cached(text: str) -> bool:
+    """Memoized LLM classification so repeated texts skip the API call."""
+    return needs_user_input(text)
 
 
 class AgentConfig(BaseModel):
     """Configuration for an agent.
 
+    Configs are immutable: the agent derives cached state (e.g., the SDK
+    options) from its config at construction.
+
     Attributes:
         namespace: Namespace for sessions, logs, and status files.
         agent_type: Category of agent (e.g., "manager", "programmer", "reviewer").
@@ -80,6 +162,8 @@ class AgentConfig(BaseModel):
         verbosity: Output verbosity level ("minimal", "medium", "verbose").
     """
 
+    model_config = ConfigDict(frozen=True)
+
     # Identity & Namespacing
     namespace: str
     agent_type: str
@@ -138,8 +222,15 @@ class Agent(ABC):
         agent = MyAgent(AgentConfig(namespace="myproject", agent_type="worker"))
         await agent.run()
         ```
+
+    Attributes:
+        REQUIRES_USER_INPUT: If False, the loop never calls `needs_user_input()`
+            and always continues with the continuation prompt. Autonomous
+            agents set this to skip the classifier round-trip between turns.
     """
 
+    REQUIRES_USER_INPUT: ClassVar[bool] = True
+
     def __init__(self, config: AgentConfig):
         """Initialize the agent with the given configuration.
 
@@ -148,11 +239,11 @@ class Agent(ABC):
         """
         self.config = config
         self._printer = create_printer(config.verbosity)
+        self._print_filter = self._printer.renderable_types()
 
-        # Session management
+        # Session management (resolved at the start of run())
         self._session_manager = SessionManager(prefix=config.namespace)
         self._session_id: str | None = None
-        self._resolve_session()
 
         # Status management
         self._status_path = get_status_path(
@@ -160,11 +251,33 @@ class Agent(ABC):
             agent_type=config.agent_type,
             agent_name=config.agent_name,
         )
-        self.update_status("starting", "Initializing agent")
+        self._last_status_payload: dict[str, Any] | None = None
+        self._last_status_write_ts: float = 0.0
+        self._pending_status: dict[str, Any] | None = None
+        self._status_flush_handle: asyncio.TimerHandle | None = None
+        # Writes are numbered on the loop thread so a write finishing late
+        # in a worker thread can't overwrite a newer status
+        self._status_write_lock = threading.Lock()
+        self._status_seq = 0
+        self._status_written_seq = 0
+        # Flush a deferred write at exit; held weakly so the registration
+        # doesn't keep the agent alive
+        atexit.register(_flush_status_at_exit, weakref.WeakMethod(self._flush_status))
+
+        # Claude SDK options that don't change between runs, assembled once
+        # so prompt building and cwd resolution stay off run()'s path
+        self._options_template: dict[str, Any] = {
+            "allowed_tools": config.allowed_tools,
+            "permission_mode": config.permission_mode,
+            "mcp_servers": config.mcp_servers if config.mcp_servers else {},
+            "system_prompt": self.get_system_prompt(),
+            "cwd": self._get_cwd(),
+        }
 
         # Internal state
         self._iteration = 0
         self._last_assistant_text = ""
+        self._assistant_batch: list[AssistantMessage] = []
 
         # Interactive input and SDK client (set up later in run())
         self._interactive: InteractiveInput | None = None
@@ -178,18 +291,30 @@ class Agent(ABC):
         # Heartbeat tracking
         self._last_heartbeat: float = time.time()
 
+        # Background I/O (session saves, heartbeats) started after a turn and
+        # awaited before the next one, so it overlaps with sending the query
+        self._pending_bg: list[asyncio.Task[Any]] = []
+
+        # Shutdown handling (SIGINT handler is installed in run())
+        self._shutdown_requested = False
+        self._shutdown_event = asyncio.Event()
+        self._current_task: asyncio.Task[Any] | None = None
+
     # ─────────────────────────────────────────────────────────────────────────
     # SESSION MANAGEMENT (handled by parent)
     # ─────────────────────────────────────────────────────────────────────────
 
-    def _resolve_session(self) -> None:
+    async def _resolve_session(self) -> None:
         """Handle session resume/new logic based on config flags.
 
-        This method is called during __init__ to determine if we should
-        resume an existing session or start a new one.
+        This method is called at the start of run(), before any status is
+        written, to determine if we should resume an existing session or
+        start a new one. The interactive prompt runs on the event loop, so
+        Ctrl+C at the prompt raises KeyboardInterrupt right away.
 
         Raises:
             ValueError: If resume=True but no existing session found.
+            KeyboardInterrupt: If Ctrl+C is pressed at the prompt.
         """
         existing = self._session_manager.get_session(
             self.config.agent_type,
@@ -208,9 +333,13 @@ class Agent(ABC):
                 self._printer.console.print("Resuming previous session...")
             else:
                 # Interactive prompt
-                self._printer.console.print("Found previous session:")
-                print(format_session_info(existing))
-                response = input("Continue previous session? [y/N]: ").strip().lower()
+                console = self._printer.console
+                console.print("Found previous session:")
+                console.print(format_session_info(existing), highlight=False)
+                response = await PromptSession().prompt_async(
+                    "Continue previous session? [y/N]: "
+                )
+                response = response.strip().lower()
                 if response == "y":
                     self._session_id = existing.session_id
                     self._printer.console.print("Resuming session...")
@@ -231,7 +360,8 @@ class Agent(ABC):
     ) -> None:
         """Save session info for crash recovery.
 
-        Called automatically by the loop after each ResultMessage.
+        Called automatically by the loop after each ResultMessage, in a
+        worker thread that overlaps with sending the next query.
 
         Args:
             session_id: The session ID from the ResultMessage.
@@ -254,21 +384,137 @@ class Agent(ABC):
     def update_status(self, status: str, details: str = "", **extra: Any) -> None:
         """Update the agent's status file.
 
+        Writes are debounced: an update identical to the previous one is
+        dropped, and updates arriving within STATUS_DEBOUNCE_INTERVAL of the
+        last write are coalesced into a single delayed write. Final statuses
+        ("exited:*") are always written immediately.
+
         Args:
             status: Current status (e.g., "working", "idle", "exited:success").
             details: Human-readable description of current activity.
             **extra: Additional fields to include (e.g., current_issue=3).
         """
-        update_status(
-            self._status_path,
-            status=status,
-            details=details,
-            agent_type=self.config.agent_type,
-            name=self.config.agent_name,
-            project=self.config.namespace,
-            **extra,
+        payload = {"status": status, "details": details, **extra}
+        if self._should_write_status(payload):
+            self._write_status(payload)
+
+    async def aupdate_status(
+        self, status: str, details: str = "", **extra: Any
+    ) -> None:
+        """Update the agent's status file without blocking the event loop.
+
+        Same debouncing as `update_status()`, but the file write runs in a
+        worker thread.
+
+        Args:
+            status: Current status (e.g., "working", "idle", "exited:success").
+            details: Human-readable description of current activity.
+            **extra: Additional fields to include (e.g., current_issue=3).
+        """
+        payload = {"status": status, "details": details, **extra}
+        if self._should_write_status(payload):
+            seq = self._begin_status_write()
+            await asyncio.to_thread(self._write_status_file, payload, seq)
+
+    def _should_write_status(self, payload: dict[str, Any]) -> bool:
+        """Apply debouncing to a status update.
+
+        Args:
+            payload: The status, details, and extra fields to write.
+
+        Returns:
+            True if the payload should be written now. False if it was
+            dropped as a duplicate or deferred to a scheduled flush.
+        """
+        if payload == self._last_status_payload:
+            return False
+        self._last_status_payload = payload
+
+        elapsed = time.monotonic() - self._last_status_write_ts
+        if payload["status"].startswith("exited:"):
+            return True
+        if elapsed >= STATUS_DEBOUNCE_INTERVAL:
+            return True
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop to schedule a flush on; write now
+            return True
+        self._pending_status = payload
+        if self._status_flush_handle is None:
+            self._status_flush_handle = loop.call_later(
+                STATUS_DEBOUNCE_INTERVAL - elapsed, self._start_status_flush
+            )
+        return False
+
+    def _flush_status(self) -> None:
+        """Write any status update held back by debouncing."""
+        if self._pending_status is not None:
+            self._write_status(self._pending_status)
+
+    def _start_status_flush(self) -> None:
+        """Write the status held back by debouncing in a worker thread.
+
+        Called by the event loop when the debounce interval has passed.
+        """
+        self._status_flush_handle = None
+        payload = self._pending_status
+        if payload is None:
+            return
+        seq = self._begin_status_write()
+        self._pending_bg.append(
+            asyncio.create_task(
+                asyncio.to_thread(self._write_status_file, payload, seq)
+            )
         )
 
+    def _write_status(self, payload: dict[str, Any]) -> None:
+        """Write a status payload to the status file, bypassing debouncing.
+
+        Args:
+            payload: The status, details, and extra fields to write.
+        """
+        self._write_status_file(payload, self._begin_status_write())
+
+    def _begin_status_write(self) -> int:
+        """Record that a status write is starting, superseding pending ones.
+
+        Must be called on the event loop thread, before the write itself.
+
+        Returns:
+            The sequence number to pass to `_write_status_file()`.
+        """
+        if self._status_flush_handle is not None:
+            self._status_flush_handle.cancel()
+            self._status_flush_handle = None
+        self._pending_status = None
+        self._last_status_write_ts = time.monotonic()
+        self._status_seq += 1
+        return self._status_seq
+
+    def _write_status_file(self, payload: dict[str, Any], seq: int) -> None:
+        """Write a status payload to the status file.
+
+        Safe to call from a worker thread. Skipped if a later write (by
+        sequence number) has already been made.
+
+        Args:
+            payload: The status, details, and extra fields to write.
+            seq: The number returned by `_begin_status_write()`.
+        """
+        with self._status_write_lock:
+            if seq < self._status_written_seq:
+                return
+            update_status(
+                self._status_path,
+                agent_type=self.config.agent_type,
+                name=self.config.agent_name,
+                project=self.config.namespace,
+                **payload,
+            )
+            self._status_written_seq = seq
+
     def read_status(self) -> dict[str, Any] | None:
         """Read the current status file.
 
@@ -277,23 +523,32 @@ class Agent(ABC):
         """
         return read_status(self._status_path)
 
-    def _maybe_heartbeat(self) -> None:
+    async def _maybe_heartbeat(self) -> None:
         """Update status file if enough time has passed since last update.
 
         This ensures the status file's last_update timestamp is fresh,
         allowing other agents (e.g., the manager) to detect stale agents.
+        File I/O runs in a worker thread to keep the event loop free.
         """
         now = time.time()
         if now - self._last_heartbeat >= HEARTBEAT_INTERVAL:
-            current = self.read_status()
-            if current:
-                # Preserve current status, just refresh the timestamp
-                self.update_status(
-                    current.get("status", "working"),
-                    current.get("details", ""),
-                    current_issue=current.get("current_issue"),
-                    current_pr=current.get("current_pr"),
-                )
+            current = await asyncio.to_thread(self.read_status)
+            # An update held back by debouncing is newer than the file, and
+            # writing now supersedes its scheduled flush; write it instead
+            payload = self._pending_status
+            if payload is None and current:
+                # Preserve current status, just refresh the timestamp. This
+                # bypasses debouncing since the payload is often unchanged.
+                payload = {
+                    "status": current.get("status", "working"),
+                    "details": current.get("details", ""),
+                    "current_issue": current.get("current_issue"),
+                    "current_pr": current.get("current_pr"),
+                }
+                self._last_status_payload = payload
+            if payload is not None:
+                seq = self._begin_status_write()
+                await asyncio.to_thread(self._write_status_file, payload, seq)
             self._last_heartbeat = now
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -307,6 +562,10 @@ class Agent(ABC):
         This prompt sets up the agent's capabilities, personality, workflow,
         and any domain-specific instructions.
 
+        Called once, from `Agent.__init__()`, to build the SDK options.
+        Subclasses must set any attributes this method uses before calling
+        `super().__init__()`.
+
         Returns:
             The system prompt string.
         """
@@ -325,7 +584,7 @@ class Agent(ABC):
         ...
 
     @abstractmethod
-    def is_complete(self, result: ResultMessage) -> bool:
+    def is_complete(self, result: "ResultMessage") -> bool:
         """Check if the agent's work is done.
 
         Called after each ResultMessage. Return True to exit the loop
@@ -370,24 +629,49 @@ class Agent(ABC):
     def needs_user_input(self, text: str) -> bool:
         """Determine if the agent's response requires user input.
 
-        Default implementation uses an LLM to classify whether the text
-        contains a question that needs user input.
+        Default implementation uses cheap checks first: text whose final
+        sentence is a question or request (QUESTION_RE) needs input, and text
+        with no question mark or input-request phrase does not. Only the
+        ambiguous remainder is classified by an LLM, memoized so repeated
+        texts are only sent once.
 
         Override this method to customize user input detection.
 
         Args:
-            text: The agent's last response text.
+            text: The trailing MAX_ASSISTANT_TEXT_CHARS characters of the
+                text of the agent's last message in the turn.
 
         Returns:
             True if user input is needed, False otherwise.
         """
-        return needs_user_input(text)
+        if QUESTION_RE.search(text[-QUESTION_SCAN_CHARS:]):
+            return True
+        if not may_need_user_input(text):
+            return False
+        return _needs_user_input_cached(text)
+
+    def on_assistant_turn(self, messages: list["AssistantMessage"], text: str) -> None:
+        """Hook called once per turn with all assistant messages of the turn.
+
+        Called when the turn ends (before `on_result()`). Override to
+        process a turn's assistant output in one go (e.g., extracting
+        state, logging). The default implementation calls
+        `on_assistant_message()` for each message, if it is overridden.
+
+        Args:
+            messages: The AssistantMessages received during the turn.
+            text: Extracted text content of all messages, newline-joined.
+        """
+        if type(self).on_assistant_message is Agent.on_assistant_message:
+            return
+        for message in messages:
+            self.on_assistant_message(message, extract_assistant_text(message))
 
-    def on_assistant_message(self, message: AssistantMessage, text: str) -> None:
-        """Hook called when the assistant sends a message.
+    def on_assistant_message(self, message: "AssistantMessage", text: str) -> None:
+        """Hook called for each assistant message, at the end of its turn.
 
-        Override to perform custom processing on assistant messages
-        (e.g., extracting state, logging).
+        Prefer overriding `on_assistant_turn()`, which receives the whole
+        turn at once.
 
         Args:
             message: The full AssistantMessage object.
@@ -395,7 +679,7 @@ class Agent(ABC):
         """
         pass
 
-    def on_result(self, result: ResultMessage) -> None:
+    def on_result(self, result: "ResultMessage") -> None:
         """Hook called when a result is received (before is_complete check).
 
         Override to perform custom processing on results (e.g., updating
@@ -498,6 +782,35 @@ class Agent(ABC):
             # Create a task to call interrupt (we're in a sync callback)
             asyncio.create_task(self._interrupt_current_turn())
 
+    def _on_sigint(self) -> None:
+        """Handle Ctrl+C, as SIGINT or as a key press at the input prompt.
+
+        The first Ctrl+C requests a graceful shutdown. If a turn is running,
+        the SDK is asked to interrupt it and the turn is allowed to finish
+        so its result and session are saved; any other in-flight step
+        (idle wait, waiting for input) is cancelled right away. A second
+        Ctrl+C calls `on_shutdown()` and exits immediately.
+
+        Raises:
+            KeyboardInterrupt: On the second Ctrl+C.
+        """
+        if self._shutdown_requested:
+            self._printer.console.print("\n[red]Immediate shutdown requested.[/red]")
+            # Raised from an event loop callback, this skips run()'s handler
+            # that calls on_shutdown(), so record the exit here
+            self.on_shutdown()
+            raise KeyboardInterrupt
+
+        self._shutdown_requested = True
+        self._shutdown_event.set()
+        self._printer.console.print(
+            "\n[yellow]Shutdown requested. Press Ctrl+C again to force exit.[/yellow]"
+        )
+        if self._is_turn_running:
+            asyncio.create_task(self._interrupt_current_turn())
+        elif self._current_task and not self._current_task.done():
+            self._current_task.cancel()
+
     async def _interrupt_current_turn(self) -> None:
         """Interrupt the current turn."""
         if self._client:
@@ -514,9 +827,11 @@ class Agent(ABC):
 
         This method:
         1. Verifies stdin is a TTY (required for interactive input)
-        2. Creates the Claude SDK client with interactive input
-        3. Sends the initial prompt
-        4. Loops until completion or max iterations
+        2. Resolves whether to resume or start a new session
+        3. Writes the "starting" status
+        4. Creates the Claude SDK client with interactive input
+        5. Sends the initial prompt
+        6. Loops until completion or max iterations
 
         A persistent input prompt is shown at the bottom of the terminal.
         Users can type while the agent is working. If they submit input
@@ -526,6 +841,7 @@ class Agent(ABC):
 
         Raises:
             RuntimeError: If stdin is not a TTY.
+            ValueError: If resume=True but no existing session found.
             Exception: Re-raises any exception after calling on_error().
         """
         # Require a TTY for interactive input
@@ -535,33 +851,56 @@ class Agent(ABC):
                 "Please run this agent in an interactive terminal."
             )
 
+        await self._resolve_session()
+
         # Build Claude SDK options
+        from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
+
         options = ClaudeAgentOptions(
-            allowed_tools=self.config.allowed_tools,
-            permission_mode=self.config.permission_mode,
-            mcp_servers=self.config.mcp_servers if self.config.mcp_servers else {},
+            **self._options_template,
             resume=self._session_id,
-            system_prompt=self.get_system_prompt(),
-            cwd=self._get_cwd(),
             env={
                 "ANTHROPIC_API_KEY": "",  # Empty ANTHROPIC_API_KEY to prevent SDK from using API key
                 "CLAUDE_CODE_OAUTH_TOKEN": get_claude_code_token(),
             },
         )
 
+        client = ClaudeSDKClient(options=options)
+
         # Create interactive input with our callback
         self._interactive = InteractiveInput(
             on_input=self._handle_user_input,
             prompt="> ",
+            on_interrupt=self._on_sigint,
         )
 
+        # Route Ctrl+C through the event loop so it can cancel in-flight awaits
+        loop = asyncio.get_running_loop()
         try:
+            loop.add_signal_handler(signal.SIGINT, self._on_sigint)
+        except NotImplementedError:
+            # Not supported on this platform; fall back to KeyboardInterrupt
+            pass
+
+        try:
+            # Write the "starting" status in a worker thread while the SDK
+            # connects. connect() must be awaited in this task, not a
+            # separate one: the SDK's task group has to be exited by the
+            # same task that entered it, and disconnect() runs here.
+            starting = asyncio.create_task(
+                self.aupdate_status("starting", "Initializing agent")
+            )
+            try:
+                await client.connect()
+            finally:
+                await starting
+
             async with self._interactive:
                 # Start the input listener as a background task
                 self._input_task = asyncio.create_task(self._interactive.run())
 
                 try:
-                    await self._run_loop(options)
+                    await self._run_loop(client)
                 finally:
                     # Cancel the input task and suppress its exceptions
                     self._cleanup_input_task()
@@ -573,6 +912,10 @@ class Agent(ABC):
         except Exception as e:
             self.on_error(e)
             raise
+        finally:
+            await client.disconnect()
+            with contextlib.suppress(NotImplementedError):
+                loop.remove_signal_handler(signal.SIGINT)
 
     def _cleanup_input_task(self) -> None:
         """Clean up the input task, suppressing expected exceptions."""
@@ -592,42 +935,99 @@ class Agent(ABC):
         if self._interactive:
             self._interactive.stop()
 
-    async def _run_loop(self, options: ClaudeAgentOptions) -> None:
+    async def _run_loop(self, client: "ClaudeSDKClient") -> None:
         """Run the main agent loop.
 
         Args:
-            options: The ClaudeAgentOptions for the SDK client.
+            client: The connected SDK client. The caller disconnects it.
+
+        Raises:
+            KeyboardInterrupt: If shutdown was requested while connecting.
         """
         assert self._interactive is not None
 
-        async with ClaudeSDKClient(options=options) as client:
-            self._client = client
+        if self._shutdown_requested:
+            raise KeyboardInterrupt
+        self._client = client
 
-            try:
-                # Send initial prompt
-                await self._send_message(self.get_initial_prompt())
+        try:
+            # Send initial prompt
+            await self._send_message(self.get_initial_prompt())
 
-                while self._iteration < self.config.max_iterations:
-                    self._iteration += 1
+            max_iterations = self.config.max_iterations
+            while self._iteration < max_iterations:
+                self._iteration += 1
 
-                    result = await self._process_turn()
+                result = await self._run_interruptible(self._process_turn())
 
-                    # Update heartbeat after each turn
-                    self._maybe_heartbeat()
+                # Update heartbeat after each turn
+                self._pending_bg.append(asyncio.create_task(self._maybe_heartbeat()))
 
-                    if result.should_exit:
-                        return
+                if result.should_exit:
+                    return
 
-                    next_prompt = await self._get_next_prompt(result.was_interrupted)
-                    if next_prompt:
-                        await self._send_message(next_prompt)
+                next_prompt = await self._run_interruptible(
+                    self._get_next_prompt(result.was_interrupted)
+                )
+                if next_prompt:
+                    await self._send_message(next_prompt)
 
-                # Check if we hit max iterations
-                if self._iteration >= self.config.max_iterations:
-                    self.on_max_iterations()
+            # Check if we hit max iterations
+            if self._iteration >= max_iterations:
+                # Let the last heartbeat finish so it can't overwrite the
+                # final status
+                await self._drain_background_tasks()
+                self.on_max_iterations()
 
-            finally:
-                self._client = None
+        finally:
+            self._client = None
+            await self._drain_background_tasks()
+
+    async def _drain_background_tasks(self) -> None:
+        """Wait for background I/O started during the previous turn.
+
+        Raises:
+            Exception: The first exception raised by a background task.
+        """
+        if not self._pending_bg:
+            return
+        pending, self._pending_bg = self._pending_bg, []
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        for outcome in results:
+            if isinstance(outcome, Exception):
+                raise outcome
+
+    async def _run_interruptible(self, coro: Awaitable[T]) -> T:
+        """Run a loop step, racing it against a shutdown request.
+
+        Args:
+            coro: The awaitable for the step (e.g., one turn).
+
+        Returns:
+            The step's result.
+
+        Raises:
+            KeyboardInterrupt: If shutdown was requested while the step ran.
+        """
+        task = asyncio.ensure_future(coro)
+        self._current_task = task
+        shutdown_task = asyncio.create_task(self._shutdown_event.wait())
+        try:
+            await asyncio.wait(
+                {task, shutdown_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if self._shutdown_requested:
+                if not self._is_turn_running:
+                    task.cancel()
+                # A running turn was interrupted by _on_sigint; let it wind down
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+                raise KeyboardInterrupt
+        finally:
+            shutdown_task.cancel()
+            self._current_task = None
+
+        return task.result()
 
     async def _send_message(self, prompt: str) -> None:
         """Send a message to the agent.
@@ -657,48 +1057,107 @@ class Agent(ABC):
         assert self._interactive is not None
         assert self._client is not None
 
+        # Mark the turn running before the first await: _run_interruptible()
+        # checks it to decide whether a shutdown request cancels this step
+        # or lets the interrupted turn wind down
         self._last_assistant_text = ""
+        self._assistant_batch = []
         self._is_turn_running = True
         self._interactive.status = "thinking"
 
         result = TurnResult()
 
+        print_message = self._printer.print_message
+        print_filter = self._print_filter
+        handlers = _get_message_handlers()
+
         try:
-            async for message in self._client.receive_response():
-                self._printer.print_message(message)
-
-                if isinstance(message, AssistantMessage):
-                    text = extract_assistant_text(message)
-                    self._last_assistant_text = text
-                    self.on_assistant_message(message, text)
-                    self._interactive.status = "working"
-
-                if isinstance(message, ResultMessage):
-                    self._save_session(
-                        session_id=message.session_id,
-                        num_turns=message.num_turns,
-                        cost_usd=message.total_cost_usd,
-                    )
-                    self.on_result(message)
+            # The next query is already sent; finish the previous turn's I/O
+            await self._drain_background_tasks()
 
-                    # Check if this was interrupted (user input is pending)
-                    if self._pending_input is not None:
-                        result.was_interrupted = True
-                    elif self.is_complete(message):
-                        self.on_complete()
-                        result.should_exit = True
+            if self._shutdown_requested:
+                # Ctrl+C arrived before the turn started (e.g., while the
+                # query was sent), so _on_sigint had no turn to interrupt
+                await self._interrupt_current_turn()
 
-        except Exception:
-            if self._pending_input is not None:
-                # Interrupted by user input
-                result.was_interrupted = True
-            else:
-                raise
+            try:
+                async for message in self._client.receive_response():
+                    message_type = type(message)
+                    if print_filter is None or message_type in print_filter:
+                        print_message(message)
+
+                    handler = handlers.get(message_type)
+                    if handler is not None:
+                        handler(self, message, result)
+
+            except Exception:
+                if self._pending_input is not None:
+                    # Interrupted by user input
+                    result.was_interrupted = True
+                else:
+                    raise
         finally:
             self._is_turn_running = False
+            # Dispatch messages left over from a turn that ended early
+            if self._assistant_batch:
+                self._flush_assistant_batch()
 
         return result
 
+    def _handle_assistant_message(
+        self, message: "AssistantMessage", result: TurnResult
+    ) -> None:
+        """Handle an AssistantMessage received during a turn.
+
+        Args:
+            message: The AssistantMessage.
+            result: The TurnResult for the current turn.
+        """
+        assert self._interactive is not None
+
+        # Hooks are dispatched once per turn by _flush_assistant_batch()
+        self._assistant_batch.append(message)
+        self._interactive.status = "working"
+
+    def _flush_assistant_batch(self) -> None:
+        """Dispatch the turn's assistant messages to on_assistant_turn()."""
+        messages, self._assistant_batch = self._assistant_batch, []
+        texts = [extract_assistant_text(message) for message in messages]
+        if texts:
+            # Only the turn's last message is checked for a question, and
+            # only its tail; a question, if any, is almost always at the end
+            self._last_assistant_text = texts[-1][-MAX_ASSISTANT_TEXT_CHARS:]
+        self.on_assistant_turn(messages, "\n".join(t for t in texts if t))
+
+    def _handle_result_message(
+        self, message: "ResultMessage", result: TurnResult
+    ) -> None:
+        """Handle the ResultMessage that ends a turn.
+
+        Args:
+            message: The ResultMessage.
+            result: The TurnResult for the current turn, updated in place.
+        """
+        self._flush_assistant_batch()
+        self._pending_bg.append(
+            asyncio.create_task(
+                asyncio.to_thread(
+                    self._save_session,
+                    session_id=message.session_id,
+                    num_turns=message.num_turns,
+                    cost_usd=message.total_cost_usd,
+                )
+            )
+        )
+        self.on_result(message)
+
+        # Check if this was interrupted (user input is pending)
+        if self._pending_input is not None:
+            result.was_interrupted = True
+        elif self.is_complete(message):
+            self.on_complete()
+            result.should_exit = True
+
     async def _get_next_prompt(self, was_interrupted: bool) -> str | None:
         """Determine the next prompt to send to the agent.
 
@@ -717,7 +1176,9 @@ class Agent(ABC):
             return prompt
 
         # Check if the agent is asking a question
-        if self.needs_user_input(self._last_assistant_text):
+        if type(self).REQUIRES_USER_INPUT and self.needs_user_input(
+            self._last_assistant_text
+        ):
             return await self._wait_for_user_input()
 
         # Check if we should wait before continuing
@@ -780,3 +1241,20 @@ class Agent(ABC):
             elapsed += check_interval
 
         return None  # No input received, caller should use continuation prompt
+
+
+@functools.cache
+def _get_message_handlers() -> dict[type, Callable[[Agent, Any, TurnResult], None]]:
+    """Get the message handlers for Agent._process_turn.
+
+    Built on first use so the SDK types are only imported when needed.
+
+    Returns:
+        Mapping of exact SDK message type to its Agent handler.
+    """
+    from claude_agent_sdk import AssistantMessage, ResultMessage
+
+    return {
+        AssistantMessage: Agent._handle_assistant_message,
+        ResultMessage: Agent._handle_result_message,
+    }
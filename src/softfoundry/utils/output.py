@@ -1,24 +1,50 @@
 """Output utilities for formatting and printing agent messages."""
 
 import json
+from collections.abc import Callable
 from enum import Enum
-from typing import Any
-
-from claude_agent_sdk import (
-    AssistantMessage,
-    ResultMessage,
-    SystemMessage,
-    TextBlock,
-    ThinkingBlock,
-    ToolResultBlock,
-    ToolUseBlock,
-    UserMessage,
-)
-from rich.console import Console
+from typing import TYPE_CHECKING, Any
+
+from pydantic_core import to_json
+from rich.console import Console, Group, RenderableType
 from rich.markup import escape
 from rich.panel import Panel
 from rich.text import Text
 
+# The SDK is imported lazily; only the printer's dispatch tables need the
+# concrete message classes at runtime.
+if TYPE_CHECKING:
+    from claude_agent_sdk import (
+        AssistantMessage,
+        ResultMessage,
+        SystemMessage,
+        TextBlock,
+        ThinkingBlock,
+        ToolResultBlock,
+        ToolUseBlock,
+        UserMessage,
+    )
+
+# Max characters of a Bash command shown at medium verbosity
+_BASH_MAX = 60
+
+# Max characters of the first parameter shown for other tools
+_GENERIC_VALUE_MAX = 40
+
+# Max characters of a tool result shown at verbose verbosity
+_VERBOSE_RESULT_MAX = 1000
+
+# Constant labels, styled once instead of parsing markup on every print.
+# Text.assemble and Panel copy these, so sharing them is safe.
+_USER_LABEL = Text("User:", style="bold blue")
+_TOOL_LABEL = Text("Tool:", style="yellow")
+_SYSTEM_LABEL = Text("System:", style="magenta")
+_RESULT_ARROW = Text.assemble("  ", ("->", "dim"), " ")
+_SUCCESS_LABEL = Text("Success", style="green")
+_ERROR_LABEL = Text("Error", style="red")
+_THINKING_TITLE = Text.assemble(("Thinking", "italic cyan"))
+_INPUT_TITLE = Text.assemble(("Input", "dim"))
+
 
 class Verbosity(Enum):
     """Verbosity levels for message output."""
@@ -31,6 +57,8 @@ class Verbosity(Enum):
 class MessagePrinter:
     """Handles printing of agent messages with configurable verbosity."""
 
+    __slots__ = ("_block_handlers", "_message_handlers", "console", "verbosity")
+
     def __init__(
         self,
         verbosity: Verbosity = Verbosity.MEDIUM,
@@ -45,35 +73,100 @@ class MessagePrinter:
         self.verbosity = verbosity
         self.console = console or Console()
 
+        from claude_agent_sdk import (
+            AssistantMessage,
+            ResultMessage,
+            SystemMessage,
+            TextBlock,
+            ThinkingBlock,
+            ToolResultBlock,
+            ToolUseBlock,
+            UserMessage,
+        )
+
+        # Handlers keyed by exact type; subclasses fall back to isinstance.
+        # Verbosity is fixed for the printer's lifetime, so each level gets
+        # its own handlers up front instead of branching on every message.
+        self._message_handlers: dict[type, Callable[[Any], None]]
+        self._block_handlers: dict[type, Callable[[Any], list[RenderableType]]]
+        if verbosity == Verbosity.MINIMAL:
+            self._message_handlers = {
+                AssistantMessage: self._print_assistant_message,
+                UserMessage: _ignore,
+                SystemMessage: _ignore,
+                ResultMessage: self._print_result_message_minimal,
+            }
+            self._block_handlers = {
+                TextBlock: self._render_text_block,
+                ThinkingBlock: _render_nothing,
+                ToolUseBlock: self._render_tool_use_block_minimal,
+                ToolResultBlock: _render_nothing,
+            }
+        elif verbosity == Verbosity.MEDIUM:
+            self._message_handlers = {
+                AssistantMessage: self._print_assistant_message,
+                UserMessage: self._print_user_message,
+                SystemMessage: self._print_system_message_medium,
+                ResultMessage: self._print_result_message_medium,
+            }
+            self._block_handlers = {
+                TextBlock: self._render_text_block,
+                ThinkingBlock: self._render_thinking_block_medium,
+                ToolUseBlock: self._render_tool_use_block_medium,
+                ToolResultBlock: self._render_tool_result_block_medium,
+            }
+        else:  # VERBOSE
+            self._message_handlers = {
+                AssistantMessage: self._print_assistant_message,
+                UserMessage: self._print_user_message,
+                SystemMessage: self._print_system_message_verbose,
+                ResultMessage: self._print_result_message_verbose,
+            }
+            self._block_handlers = {
+                TextBlock: self._render_text_block,
+                ThinkingBlock: self._render_thinking_block_verbose,
+                ToolUseBlock: self._render_tool_use_block_verbose,
+                ToolResultBlock: self._render_tool_result_block_verbose,
+            }
+
+    def renderable_types(self) -> frozenset[type] | None:
+        """Get the message types that produce output at this verbosity.
+
+        Callers streaming many messages can use this to skip calling
+        print_message() for messages that would be dropped anyway.
+
+        Returns:
+            The set of message types that are rendered, or None if every
+            message type may produce output.
+        """
+        from claude_agent_sdk import AssistantMessage, ResultMessage
+
+        if self.verbosity == Verbosity.MINIMAL:
+            return frozenset({AssistantMessage, ResultMessage})
+        return None
+
     def print_message(self, message: Any) -> None:
         """Print a message based on its type.
 
         Args:
             message: The message to print (any SDK message type).
         """
-        if isinstance(message, AssistantMessage):
-            self._print_assistant_message(message)
-        elif isinstance(message, UserMessage):
-            self._print_user_message(message)
-        elif isinstance(message, SystemMessage):
-            self._print_system_message(message)
-        elif isinstance(message, ResultMessage):
-            self._print_result_message(message)
-        else:
+        handler = _find_handler(self._message_handlers, message)
+        if handler is not None:
+            handler(message)
+        elif self.verbosity == Verbosity.VERBOSE:
             # Handle unknown message types
-            if self.verbosity == Verbosity.VERBOSE:
-                self.console.print(
-                    f"[dim]Unknown message type: {type(message).__name__}[/dim]"
-                )
+            self.console.print(
+                f"[dim]Unknown message type: {type(message).__name__}[/dim]"
+            )
 
-    def _print_user_message(self, message: UserMessage) -> None:
+    def _print_user_message(self, message: "UserMessage") -> None:
         """Print a user message."""
-        if self.verbosity == Verbosity.MINIMAL:
-            return
+        from claude_agent_sdk import ToolResultBlock
 
         content = message.content
         if isinstance(content, str):
-            self.console.print(f"[bold blue]User:[/bold blue] {escape(content)}")
+            self.console.print(Text.assemble(_USER_LABEL, " ", content))
         elif isinstance(content, list):
             # Check if this message contains only tool results (no actual user text)
             # Tool results are printed separately after ToolUseBlock, so skip "User:" label
@@ -81,89 +174,86 @@ class MessagePrinter:
                 not isinstance(block, ToolResultBlock) for block in content
             )
             if has_non_tool_content:
-                self.console.print("[bold blue]User:[/bold blue]")
+                self.console.print(_USER_LABEL)
             for block in content:
                 self._print_content_block(block)
 
-    def _print_assistant_message(self, message: AssistantMessage) -> None:
-        """Print an assistant message with all its content blocks."""
+    def _print_assistant_message(self, message: "AssistantMessage") -> None:
+        """Print an assistant message with all its content blocks.
+
+        The blocks are rendered first and written with a single print call,
+        so a message costs one layout pass and one write regardless of how
+        many blocks it has.
+        """
+        renderables: list[RenderableType] = []
         for block in message.content:
-            self._print_content_block(block)
+            renderables.extend(self._render_content_block(block))
+        if renderables:
+            self.console.print(Group(*renderables))
 
     def _print_content_block(self, block: Any) -> None:
         """Print a single content block based on its type."""
-        if isinstance(block, TextBlock):
-            self._print_text_block(block)
-        elif isinstance(block, ThinkingBlock):
-            self._print_thinking_block(block)
-        elif isinstance(block, ToolUseBlock):
-            self._print_tool_use_block(block)
-        elif isinstance(block, ToolResultBlock):
-            self._print_tool_result_block(block)
-        else:
+        for renderable in self._render_content_block(block):
+            self.console.print(renderable)
+
+    def _render_content_block(self, block: Any) -> list[RenderableType]:
+        """Render a single content block based on its type."""
+        handler = _find_handler(self._block_handlers, block)
+        if handler is not None:
+            return handler(block)
+        if self.verbosity == Verbosity.VERBOSE:
             # Fallback for unknown block types
-            if self.verbosity == Verbosity.VERBOSE:
-                self.console.print(
-                    f"[dim]Unknown block type: {type(block).__name__}[/dim]"
-                )
+            return [f"[dim]Unknown block type: {type(block).__name__}[/dim]"]
+        return []
 
-    def _print_text_block(self, block: TextBlock) -> None:
-        """Print a text block."""
+    def _render_text_block(self, block: "TextBlock") -> list[RenderableType]:
+        """Render a text block."""
         if block.text.strip():
-            self.console.print(escape(block.text))
-
-    def _print_thinking_block(self, block: ThinkingBlock) -> None:
-        """Print a thinking block."""
-        if self.verbosity == Verbosity.MINIMAL:
-            return
-
-        if self.verbosity == Verbosity.MEDIUM:
-            # Show truncated thinking
-            thinking = block.thinking
-            if len(thinking) > 200:
-                thinking = thinking[:200] + "..."
-            self.console.print(
-                Panel(
-                    escape(thinking),
-                    title="[italic cyan]Thinking[/italic cyan]",
-                    border_style="cyan",
-                    padding=(0, 1),
-                )
-            )
-        else:  # VERBOSE
-            self.console.print(
-                Panel(
-                    escape(block.thinking),
-                    title="[italic cyan]Thinking[/italic cyan]",
-                    border_style="cyan",
-                    padding=(0, 1),
-                )
-            )
-
-    def _print_tool_use_block(self, block: ToolUseBlock) -> None:
-        """Print a tool use block with appropriate detail level."""
-        tool_name = block.name
-        tool_input = block.input
-
-        if self.verbosity == Verbosity.MINIMAL:
-            self.console.print(f"[yellow]Tool:[/yellow] {tool_name}")
-            return
-
-        # Build the tool info string
-        tool_info = self._format_tool_input(tool_name, tool_input)
-
-        if self.verbosity == Verbosity.MEDIUM:
-            self.console.print(f"[yellow]Tool:[/yellow] {tool_name} {tool_info}")
-        else:  # VERBOSE
-            self.console.print(f"[yellow]Tool:[/yellow] {tool_name}")
-            self.console.print(
-                Panel(
-                    self._format_json(tool_input),
-                    title="[dim]Input[/dim]",
-                    border_style="yellow",
-                    padding=(0, 1),
-                )
+            return [Text(block.text)]
+        return []
+
+    def _render_thinking_block_medium(
+        self, block: "ThinkingBlock"
+    ) -> list[RenderableType]:
+        """Render a thinking block, truncated."""
+        return [_thinking_panel(_truncate(block.thinking, 200))]
+
+    def _render_thinking_block_verbose(
+        self, block: "ThinkingBlock"
+    ) -> list[RenderableType]:
+        """Render a thinking block in full."""
+        return [_thinking_panel(block.thinking)]
+
+    def _render_tool_use_block_minimal(
+        self, block: "ToolUseBlock"
+    ) -> list[RenderableType]:
+        """Render a tool use block as just the tool name."""
+        return [Text.assemble(_TOOL_LABEL, " ", block.name)]
+
+    def _render_tool_use_block_medium(
+        self, block: "ToolUseBlock"
+    ) -> list[RenderableType]:
+        """Render a tool use block with its key parameters."""
+        tool_info = self._format_tool_input(block.name, block.input)
+        return [
+            Text.assemble(
+                _TOOL_LABEL, " ", block.name, " ", Text.from_markup(tool_info)
             )
+        ]
+
+    def _render_tool_use_block_verbose(
+        self, block: "ToolUseBlock"
+    ) -> list[RenderableType]:
+        """Render a tool use block with its full input."""
+        return [
+            Text.assemble(_TOOL_LABEL, " ", block.name),
+            Panel(
+                self._format_json(block.input),
+                title=_INPUT_TITLE,
+                border_style="yellow",
+                padding=(0, 1),
+            ),
+        ]
 
     def _format_tool_input(self, tool_name: str, tool_input: dict[str, Any]) -> str:
         """Format tool input for medium verbosity display.
@@ -175,96 +265,59 @@ class MessagePrinter:
         Returns:
             A formatted string with key parameters.
         """
-        # Tool-specific formatting for common tools
-        if tool_name == "Read":
-            file_path = tool_input.get("file_path", tool_input.get("filePath", ""))
-            return f"[dim]({escape(file_path)})[/dim]"
-
-        elif tool_name == "Write":
-            file_path = tool_input.get("file_path", tool_input.get("filePath", ""))
-            return f"[dim]({escape(file_path)})[/dim]"
-
-        elif tool_name == "Edit":
-            file_path = tool_input.get("file_path", tool_input.get("filePath", ""))
-            return f"[dim]({escape(file_path)})[/dim]"
-
-        elif tool_name == "Bash":
-            command = tool_input.get("command", "")
-            if len(command) > 60:
-                command = command[:60] + "..."
-            return f"[dim]({escape(command)})[/dim]"
+        formatter = _TOOL_FORMATTERS.get(tool_name, _format_generic_input)
+        return formatter(tool_input)
 
-        elif tool_name == "Glob":
-            pattern = tool_input.get("pattern", "")
-            return f"[dim]({escape(pattern)})[/dim]"
-
-        elif tool_name == "Grep":
-            pattern = tool_input.get("pattern", "")
-            return f"[dim]({escape(pattern)})[/dim]"
-
-        elif tool_name == "Task":
-            description = tool_input.get("description", "")
-            return f"[dim]({escape(description)})[/dim]"
-
-        elif tool_name == "TodoWrite":
-            todos = tool_input.get("todos", [])
-            return f"[dim]({len(todos)} items)[/dim]"
-
-        else:
-            # Generic: show first key-value pair if available
-            if tool_input:
-                first_key = next(iter(tool_input))
-                first_value = str(tool_input[first_key])
-                if len(first_value) > 40:
-                    first_value = first_value[:40] + "..."
-                return f"[dim]({first_key}={escape(first_value)})[/dim]"
-            return ""
-
-    def _print_tool_result_block(self, block: ToolResultBlock) -> None:
-        """Print a tool result block."""
-        if self.verbosity == Verbosity.MINIMAL:
-            return
-
-        is_error = block.is_error or False
+    def _render_tool_result_block_medium(
+        self, block: "ToolResultBlock"
+    ) -> list[RenderableType]:
+        """Render a tool result block as a one-line outcome."""
         content = block.content
         content_str = self._format_tool_result_content(content) if content else ""
 
-        if self.verbosity == Verbosity.MEDIUM:
-            if is_error and content_str.strip():
-                # Always show error content at MEDIUM verbosity
-                error_text = content_str.strip()
-                # Get first line or truncate
-                first_line = error_text.split("\n")[0]
-                if len(first_line) > 100:
-                    first_line = first_line[:100] + "..."
-                self.console.print(
-                    f"  [dim]->[/dim] [red]Error:[/red] {escape(first_line)}"
-                )
-            else:
-                # Show success with brief summary
-                summary = self._get_result_summary(content_str)
-                if summary:
-                    self.console.print(
-                        f"  [dim]->[/dim] [green]Success[/green] {summary}"
-                    )
-                else:
-                    self.console.print("  [dim]->[/dim] [green]Success[/green]")
-        else:  # VERBOSE
-            status = "[red]Error[/red]" if is_error else "[green]Success[/green]"
-            if content_str.strip():
-                self.console.print(f"  [dim]->[/dim] {status}")
-                # Truncate very long results
-                if len(content_str) > 1000:
-                    content_str = content_str[:1000] + "\n... (truncated)"
-                self.console.print(
-                    Panel(
-                        escape(content_str),
-                        border_style="green" if not is_error else "red",
-                        padding=(0, 1),
-                    )
+        if block.is_error and content_str.strip():
+            # Always show error content at MEDIUM verbosity
+            error_text = content_str.strip()
+            # Get first line or truncate
+            first_line = _truncate(error_text.partition("\n")[0], 100)
+            return [Text.assemble(_RESULT_ARROW, ("Error:", "red"), " ", first_line)]
+        # Show success with brief summary
+        summary = self._get_result_summary(content_str)
+        if summary:
+            return [
+                Text.assemble(
+                    _RESULT_ARROW, _SUCCESS_LABEL, " ", Text.from_markup(summary)
                 )
-            else:
-                self.console.print(f"  [dim]->[/dim] {status}")
+            ]
+        return [Text.assemble(_RESULT_ARROW, _SUCCESS_LABEL)]
+
+    def _render_tool_result_block_verbose(
+        self, block: "ToolResultBlock"
+    ) -> list[RenderableType]:
+        """Render a tool result block with its content."""
+        is_error = block.is_error or False
+        content = block.content
+        content_str = (
+            self._format_tool_result_content(content, limit=_VERBOSE_RESULT_MAX)
+            if content
+            else ""
+        )
+
+        status = Text.assemble(
+            _RESULT_ARROW, _ERROR_LABEL if is_error else _SUCCESS_LABEL
+        )
+        if not content_str.strip():
+            return [status]
+        # Truncate very long results
+        content_str = _truncate(content_str, _VERBOSE_RESULT_MAX, "\n... (truncated)")
+        return [
+            status,
+            Panel(
+                Text(content_str),
+                border_style="green" if not is_error else "red",
+                padding=(0, 1),
+            ),
+        ]
 
     def _get_result_summary(self, content: str) -> str:
         """Generate a brief summary of successful tool result content.
@@ -295,56 +348,70 @@ class MessagePrinter:
         else:
             return ""
 
-    def _format_tool_result_content(self, content: str | list[dict[str, Any]]) -> str:
-        """Format tool result content to a string."""
+    def _format_tool_result_content(
+        self, content: str | list[dict[str, Any]], limit: int | None = None
+    ) -> str:
+        """Format tool result content to a string.
+
+        Args:
+            content: The tool result content.
+            limit: If set, stop formatting list items once the result is
+                longer than this. Callers truncating the result anyway can
+                use it to skip formatting items they would drop.
+
+        Returns:
+            The content as a single string.
+        """
         if isinstance(content, str):
             return content
         elif isinstance(content, list):
             # Handle list of content blocks
             parts = []
+            length = -1
             for item in content:
-                if isinstance(item, dict):
-                    if item.get("type") == "text":
-                        parts.append(item.get("text", ""))
-                    else:
-                        parts.append(json.dumps(item))
-                else:
-                    parts.append(str(item))
+                part = _format_content_item(item)
+                parts.append(part)
+                length += len(part) + 1
+                if limit is not None and length > limit:
+                    break
             return "\n".join(parts)
         return str(content)
 
-    def _print_system_message(self, message: SystemMessage) -> None:
-        """Print a system message."""
-        if self.verbosity == Verbosity.MINIMAL:
-            return
-
-        subtype = message.subtype
+    def _print_system_message_medium(self, message: "SystemMessage") -> None:
+        """Print a system message's subtype."""
+        self.console.print(Text.assemble(_SYSTEM_LABEL, " ", message.subtype))
 
-        if self.verbosity == Verbosity.MEDIUM:
-            self.console.print(f"[magenta]System:[/magenta] {subtype}")
-        else:  # VERBOSE
-            self.console.print(f"[magenta]System:[/magenta] {subtype}")
-            if message.data:
-                self.console.print(
-                    Panel(
-                        self._format_json(message.data),
-                        border_style="magenta",
-                        padding=(0, 1),
-                    )
+    def _print_system_message_verbose(self, message: "SystemMessage") -> None:
+        """Print a system message's subtype and data."""
+        self._print_system_message_medium(message)
+        if message.data:
+            self.console.print(
+                Panel(
+                    self._format_json(message.data),
+                    border_style="magenta",
+                    padding=(0, 1),
                 )
+            )
 
-    def _print_result_message(self, message: ResultMessage) -> None:
-        """Print a result message with summary information."""
-        is_error = message.is_error
-        subtype = message.subtype
-
-        if is_error:
+    def _print_result_message_minimal(self, message: "ResultMessage") -> None:
+        """Print a result message as a status rule."""
+        if message.is_error:
             status_text = Text("Error", style="bold red")
         else:
             status_text = Text("Complete", style="bold green")
 
+        self.console.print()
+        self.console.rule(status_text)
+
+        # Note: We don't print message.result here because it duplicates
+        # the content already shown in AssistantMessage text blocks.
+
+    def _print_result_message_medium(self, message: "ResultMessage") -> None:
+        """Print a result message with summary information."""
+        self._print_result_message_minimal(message)
+
         # Build summary info
-        info_parts = [f"[bold]{subtype}[/bold]"]
+        info_parts = [f"[bold]{message.subtype}[/bold]"]
 
         if message.duration_ms:
             duration_sec = message.duration_ms / 1000
@@ -356,26 +423,133 @@ class MessagePrinter:
         if message.num_turns:
             info_parts.append(f"Turns: {message.num_turns}")
 
-        self.console.print()
-        self.console.rule(status_text)
+        self.console.print(" | ".join(info_parts))
 
-        if self.verbosity != Verbosity.MINIMAL:
-            self.console.print(" | ".join(info_parts))
-
-        if self.verbosity == Verbosity.VERBOSE and message.usage:
+    def _print_result_message_verbose(self, message: "ResultMessage") -> None:
+        """Print a result message with summary information and usage."""
+        self._print_result_message_medium(message)
+        if message.usage:
             self.console.print(f"[dim]Usage: {self._format_json(message.usage)}[/dim]")
 
-        # Note: We don't print message.result here because it duplicates
-        # the content already shown in AssistantMessage text blocks.
-
     def _format_json(self, data: dict[str, Any]) -> str:
         """Format a dictionary as indented JSON string."""
         try:
-            return json.dumps(data, indent=2, default=str)
+            return to_json(data, indent=2, fallback=str).decode()
         except (TypeError, ValueError):
             return str(data)
 
 
+def _truncate(s: str, n: int, suffix: str = "...") -> str:
+    """Truncate a string to n characters, appending suffix if it was cut."""
+    return s if len(s) <= n else f"{s[:n]}{suffix}"
+
+
+def _format_content_item(item: Any) -> str:
+    """Format one item of a tool result's content list."""
+    if isinstance(item, dict):
+        if item.get("type") == "text":
+            return item.get("text", "")
+        return json.dumps(item, default=str)
+    return str(item)
+
+
+def _file_path(tool_input: dict[str, Any]) -> str:
+    """Get a file tool's path, accepting both snake_case and camelCase keys."""
+    return tool_input.get("file_path") or tool_input.get("filePath") or ""
+
+
+def _format_file_path_input(tool_input: dict[str, Any]) -> str:
+    """Format the input of a file tool (Read, Write, Edit)."""
+    return f"[dim]({escape(_file_path(tool_input))})[/dim]"
+
+
+def _format_bash_input(tool_input: dict[str, Any]) -> str:
+    """Format the input of the Bash tool, truncating long commands."""
+    command = _truncate(tool_input.get("command", ""), _BASH_MAX)
+    return f"[dim]({escape(command)})[/dim]"
+
+
+def _format_pattern_input(tool_input: dict[str, Any]) -> str:
+    """Format the input of a search tool (Glob, Grep)."""
+    pattern = tool_input.get("pattern", "")
+    return f"[dim]({escape(pattern)})[/dim]"
+
+
+def _format_task_input(tool_input: dict[str, Any]) -> str:
+    """Format the input of the Task tool."""
+    description = tool_input.get("description", "")
+    return f"[dim]({escape(description)})[/dim]"
+
+
+def _format_todo_input(tool_input: dict[str, Any]) -> str:
+    """Format the input of the TodoWrite tool."""
+    todos = tool_input.get("todos", [])
+    return f"[dim]({len(todos)} items)[/dim]"
+
+
+def _format_generic_input(tool_input: dict[str, Any]) -> str:
+    """Format the input of any other tool: show the first key-value pair."""
+    if tool_input:
+        first_key = next(iter(tool_input))
+        first_value = _truncate(str(tool_input[first_key]), _GENERIC_VALUE_MAX)
+        return f"[dim]({first_key}={escape(first_value)})[/dim]"
+    return ""
+
+
+# Tool-specific input formatting for common tools
+_TOOL_FORMATTERS: dict[str, Callable[[dict[str, Any]], str]] = {
+    "Read": _format_file_path_input,
+    "Write": _format_file_path_input,
+    "Edit": _format_file_path_input,
+    "Bash": _format_bash_input,
+    "Glob": _format_pattern_input,
+    "Grep": _format_pattern_input,
+    "Task": _format_task_input,
+    "TodoWrite": _format_todo_input,
+}
+
+
+def _ignore(obj: Any) -> None:
+    """Handle an object that is not shown at the printer's verbosity."""
+
+
+def _render_nothing(obj: Any) -> list[RenderableType]:
+    """Render an object that is not shown at the printer's verbosity."""
+    return []
+
+
+def _thinking_panel(thinking: str) -> Panel:
+    """Wrap thinking text in its panel."""
+    return Panel(
+        Text(thinking),
+        title=_THINKING_TITLE,
+        border_style="cyan",
+        padding=(0, 1),
+    )
+
+
+def _find_handler(
+    handlers: dict[type, Callable[[Any], Any]], obj: Any
+) -> Callable[[Any], Any] | None:
+    """Look up the handler for an object by its type.
+
+    Args:
+        handlers: Handlers keyed by type.
+        obj: The object to find a handler for.
+
+    Returns:
+        The handler for the object's exact type, else for the first base
+        type it is an instance of, or None if there is none.
+    """
+    handler = handlers.get(type(obj))
+    if handler is not None:
+        return handler
+    for cls, handler in handlers.items():
+        if isinstance(obj, cls):
+            return handler
+    return None
+
+
 def create_printer(verbosity: str = "medium") -> MessagePrinter:
     """Create a MessagePrinter with the specified verbosity level.
 
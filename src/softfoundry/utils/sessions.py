@@ -4,16 +4,18 @@ Sessions are stored centrally at ~/.softfoundry/sessions/ to persist
 across different project directories and allow easy backup/cleanup.
 """
 
-import json
 import re
 from datetime import datetime
 from pathlib import Path
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 # Centralized sessions directory
 SESSIONS_DIR = Path.home() / ".softfoundry" / "sessions"
 
+# Runs of characters that aren't allowed in session filenames
+_SANITIZE_RE = re.compile(r"[^a-z0-9]+")
+
 
 class SessionInfo(BaseModel):
     """Information about a saved agent session."""
@@ -53,7 +55,7 @@ class SessionManager:
             A sanitized lowercase string (e.g., "john-doe").
         """
         # Convert to lowercase, replace spaces and special chars with hyphens
-        sanitized = re.sub(r"[^a-z0-9]+", "-", name.lower())
+        sanitized = _SANITIZE_RE.sub("-", name.lower())
         # Remove leading/trailing hyphens
         return sanitized.strip("-")
 
@@ -87,10 +89,8 @@ class SessionManager:
             return None
 
         try:
-            with open(session_path) as f:
-                data = json.load(f)
-            return SessionInfo(**data)
-        except (json.JSONDecodeError, TypeError, KeyError) as e:
+            return SessionInfo.model_validate_json(session_path.read_bytes())
+        except ValidationError as e:
             # Corrupted session file - log warning and return None
             print(f"Warning: Corrupted session file at {session_path}: {e}")
             return None
@@ -108,8 +108,7 @@ class SessionManager:
         # Ensure the sessions directory exists
         self.sessions_path.mkdir(parents=True, exist_ok=True)
 
-        with open(session_path, "w") as f:
-            json.dump(session_info.model_dump(), f, indent=2)
+        session_path.write_text(session_info.model_dump_json(indent=2))
 
     def delete_session(self, agent_type: str, agent_name: str) -> bool:
         """Delete a saved session.
@@ -168,12 +167,17 @@ def format_session_info(session: SessionInfo) -> str:
     Returns:
         A human-readable string describing the session.
     """
-    # Parse and format the timestamp
-    try:
-        dt = datetime.fromisoformat(session.last_run)
-        timestamp = dt.strftime("%Y-%m-%d %H:%M:%S")
-    except ValueError:
-        timestamp = session.last_run
+    # Format the timestamp. last_run is written by datetime.isoformat(), so
+    # the common case only needs the "T" swapped and the fraction dropped.
+    last_run = session.last_run
+    if len(last_run) >= 19 and last_run[10] == "T":
+        timestamp = last_run.replace("T", " ", 1)[:19]
+    else:
+        try:
+            dt = datetime.fromisoformat(last_run)
+            timestamp = dt.strftime("%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            timestamp = last_run
 
     lines = [
         f"  Last run: {timestamp}",
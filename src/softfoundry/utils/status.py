@@ -5,17 +5,45 @@ JSON data about each agent's current state, enabling monitoring of
 agent health and coordination between agents.
 """
 
-import json
+import contextlib
+import functools
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from pydantic_core import from_json, to_json
+
 STATUS_DIR = Path.home() / ".softfoundry" / "agents"
 STALE_THRESHOLD_SECONDS = 300  # 5 minutes
 
+_SANITIZE_RE = re.compile(r"[^a-z0-9]+")
+
+# list_agent_statuses reads in parallel above this many status files
+_PARALLEL_READ_THRESHOLD = 16
+_PARALLEL_READ_WORKERS = 8
+
+# Keep Windows from translating newlines on raw file descriptors
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+# Parsed status files keyed by path string, with the (mtime_ns, size) they
+# were read at
+_READ_CACHE: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
 
+def _pretty_status() -> bool:
+    """Check whether status files should be written as indented JSON.
+
+    Read on each write since .env is loaded after this module is imported.
+    """
+    return os.getenv("SOFTFOUNDRY_STATUS_PRETTY", "").lower() in ("1", "true", "yes")
+
+
+@functools.lru_cache(maxsize=128)
 def sanitize_name(name: str) -> str:
     """Convert a name to a safe filename slug.
 
@@ -25,8 +53,18 @@ def sanitize_name(name: str) -> str:
     Returns:
         A sanitized lowercase string (e.g., "alice-chen").
     """
-    sanitized = re.sub(r"[^a-z0-9]+", "-", name.lower())
-    return sanitized.strip("-")
+    return _SANITIZE_RE.sub("-", name.lower()).strip("-")
+
+
+@functools.lru_cache(maxsize=128)
+def _ensure_dir(dir_path: Path) -> Path:
+    """Create a directory once per process and return it.
+
+    update_status() still creates the parent directory before writing, so a
+    directory removed after it was cached is recreated when needed.
+    """
+    dir_path.mkdir(parents=True, exist_ok=True)
+    return dir_path
 
 
 def get_status_path(
@@ -43,16 +81,26 @@ def get_status_path(
     Returns:
         Path to the status file.
     """
-    dir_path = STATUS_DIR / prefix
-    dir_path.mkdir(parents=True, exist_ok=True)
+    status_path = _compute_status_path(STATUS_DIR, prefix, agent_type, agent_name)
+    _ensure_dir(status_path.parent)
+    return status_path
 
+
+@functools.lru_cache(maxsize=256)
+def _compute_status_path(
+    status_dir: Path, prefix: str, agent_type: str, agent_name: str | None
+) -> Path:
+    """Build a status file path; see get_status_path().
+
+    status_dir is part of the key so the cache follows changes to STATUS_DIR.
+    """
     # Include agent_name in filename if it's different from agent_type
     if agent_name and agent_name != agent_type and agent_name != "default":
         filename = f"{agent_type}-{sanitize_name(agent_name)}.status"
     else:
         filename = f"{agent_type}.status"
 
-    return dir_path / filename
+    return status_dir / prefix / filename
 
 
 def update_status(
@@ -64,6 +112,7 @@ def update_status(
     project: str | None = None,
     current_issue: int | None = None,
     current_pr: int | None = None,
+    durable: bool = False,
     **extra: Any,
 ) -> None:
     """Update an agent's status file.
@@ -77,22 +126,24 @@ def update_status(
         project: Project name (preserved from existing if not provided).
         current_issue: Issue number being worked on (optional).
         current_pr: PR number created (optional).
+        durable: Flush the file and its directory to disk before returning,
+            so the update survives a system crash. Costs a disk flush.
         **extra: Additional fields to include.
     """
-    # Read existing data to preserve fields
-    existing: dict[str, Any] = {}
-    if status_path.exists():
-        try:
-            existing = json.loads(status_path.read_text())
-        except (json.JSONDecodeError, OSError):
-            pass
+    # Read existing data to preserve fields. After this process's own
+    # writes this is served from the read cache without re-parsing.
+    existing = read_status(status_path) or {}
+
+    now = time.time()
+    now_iso = datetime.fromtimestamp(now).isoformat()
 
     # Build updated data, preserving existing fields
     data: dict[str, Any] = {
         **existing,
         "status": status,
         "details": details,
-        "last_update": datetime.now().isoformat(),
+        "last_update": now_iso,
+        "last_update_ts": now,
         "pid": os.getpid(),
         **extra,
     }
@@ -114,52 +165,177 @@ def update_status(
         data["current_pr"] = None
 
     # Set started_at if not already set
-    if "started_at" not in data:
-        data["started_at"] = datetime.now().isoformat()
+    data.setdefault("started_at", now_iso)
 
     # Ensure directory exists
     status_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write atomically (write to temp, then rename)
-    temp_path = status_path.with_suffix(".tmp")
-    temp_path.write_text(json.dumps(data, indent=2))
-    temp_path.rename(status_path)
+    payload = to_json(data, indent=2 if _pretty_status() else None)
+
+    path = os.fspath(status_path)
+    _READ_CACHE.pop(path, None)
+    generation = _write_status_file(status_path, payload, durable=durable)
+
+    # Keep what was written so the next update or read doesn't parse it back.
+    # The entry is checked against the file's mtime and size, so writes made
+    # by anyone else (e.g., an agent's own Bash updates) are still picked up.
+    _READ_CACHE[path] = (generation, data)
+
+
+def _write_status_file(
+    status_path: Path, payload: bytes, durable: bool
+) -> tuple[int, int]:
+    """Write a serialized status payload to the status file.
+
+    Args:
+        status_path: Path to the status file.
+        payload: The encoded JSON to write.
+        durable: Fsync the file and its directory after writing.
+
+    Returns:
+        The (mtime_ns, size) of the written file.
+    """
+    # First write: nothing to replace, so create the file directly
+    try:
+        generation = _write_file(status_path, payload, os.O_EXCL, durable)
+    except FileExistsError:
+        pass
+    else:
+        if durable:
+            _fsync_dir(status_path.parent)
+        return generation
+
+    # Overwrite atomically (write to temp, then replace). The temp name is
+    # unique per process and thread so concurrent writers never share one.
+    temp_path = status_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        generation = _write_file(temp_path, payload, os.O_TRUNC, durable)
+        os.replace(temp_path, status_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp_path)
+        raise
+    if durable:
+        _fsync_dir(status_path.parent)
+    return generation
+
+
+def _write_file(
+    path: Path, payload: bytes, flags: int, durable: bool
+) -> tuple[int, int]:
+    """Write bytes to a file with raw OS calls, skipping Python's file objects.
+
+    Args:
+        path: Path to the file.
+        payload: The bytes to write.
+        flags: Extra os.open() flags (e.g., os.O_EXCL or os.O_TRUNC).
+        durable: Fsync the file before closing it.
+
+    Returns:
+        The (mtime_ns, size) of the file as written, taken from the open
+        descriptor so a concurrent replace of the path can't be mistaken
+        for this write.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | _O_BINARY | flags, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view) :]
+        if durable:
+            os.fsync(fd)
+        st = os.fstat(fd)
+    finally:
+        os.close(fd)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _fsync_dir(dir_path: Path) -> None:
+    """Flush a directory's entries to disk, where the platform supports it."""
+    o_directory = getattr(os, "O_DIRECTORY", None)
+    if o_directory is None:
+        return
+    fd = os.open(dir_path, os.O_RDONLY | o_directory)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
 
 def read_status(status_path: Path) -> dict[str, Any] | None:
     """Read an agent's status file.
 
+    The parsed data is reused while the file's modification time and size
+    are unchanged, so repeated checks on the same file only cost a stat().
+
     Args:
         status_path: Path to the status file.
 
     Returns:
         Status data as a dictionary, or None if file doesn't exist or is invalid.
     """
-    if not status_path.exists():
+    # Work on the path string; it's cheaper to hash and pass to os calls
+    path = os.fspath(status_path)
+    try:
+        st = os.stat(path)
+    except OSError:
+        _READ_CACHE.pop(path, None)
         return None
 
+    generation = (st.st_mtime_ns, st.st_size)
+    cached = _READ_CACHE.get(path)
+    if cached is not None and cached[0] == generation:
+        return dict(cached[1])
+
     try:
-        return json.loads(status_path.read_text())
-    except (json.JSONDecodeError, OSError):
+        with open(path, "rb") as f:
+            data = from_json(f.read())
+    except (ValueError, OSError):
+        _READ_CACHE.pop(path, None)
         return None
 
+    if not isinstance(data, dict):
+        return data
+    _READ_CACHE[path] = (generation, data)
+    return dict(data)
+
 
 def is_agent_stale(
-    status_path: Path, threshold_seconds: int = STALE_THRESHOLD_SECONDS
+    status_path: Path,
+    threshold_seconds: int = STALE_THRESHOLD_SECONDS,
+    strict: bool = False,
 ) -> bool:
     """Check if an agent hasn't updated its status recently.
 
+    By default this uses the status file's modification time, which every
+    write (including agents' own Bash writes) refreshes, so the file isn't
+    read at all.
+
     Args:
         status_path: Path to the status file.
         threshold_seconds: Seconds without update to consider stale (default: 300).
+        strict: Use the update time recorded in the file instead, and treat
+            an invalid file as stale.
 
     Returns:
-        True if agent is stale or status file is missing/invalid.
+        True if agent is stale or status file is missing (or invalid, if strict).
     """
+    if not strict:
+        try:
+            age = time.time() - os.stat(os.fspath(status_path)).st_mtime
+        except OSError:
+            return True
+        return age > threshold_seconds
+
     data = read_status(status_path)
     if not data:
         return True
 
+    # Prefer the numeric timestamp; files written by hand may only have the
+    # ISO string
+    last_update_ts = data.get("last_update_ts")
+    if isinstance(last_update_ts, (int, float)):
+        return time.time() - last_update_ts > threshold_seconds
+
     try:
         last_update = datetime.fromisoformat(data["last_update"])
         age = (datetime.now() - last_update).total_seconds()
@@ -171,15 +347,41 @@ def is_agent_stale(
 def is_agent_exited(status_path: Path) -> bool:
     """Check if an agent has exited (successfully or with error).
 
+    Answered from the read cache when the file is unchanged since it was
+    last parsed.
+
     Args:
         status_path: Path to the status file.
 
     Returns:
         True if agent status starts with "exited:".
     """
-    data = read_status(status_path)
+    path = os.fspath(status_path)
+    try:
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            generation = (st.st_mtime_ns, st.st_size)
+            cached = _READ_CACHE.get(path)
+            if cached is not None and cached[0] == generation:
+                return cached[1].get("status", "").startswith("exited:")
+            blob = f.read()
+    except OSError:
+        return False
+
+    # An exited agent's file always contains the marker, so its absence
+    # decides the common case without parsing. Its presence doesn't settle
+    # it (e.g., "details" may mention it), so a match is confirmed on the JSON
+    if b"exited:" not in blob:
+        return False
+
+    try:
+        data = from_json(blob)
+    except ValueError:
+        return False
     if not data:
         return False
+    if isinstance(data, dict):
+        _READ_CACHE[path] = (generation, data)
 
     status = data.get("status", "")
     return status.startswith("exited:")
@@ -212,13 +414,41 @@ def list_agent_statuses(prefix: str) -> list[tuple[Path, dict[str, Any]]]:
         List of (path, data) tuples for each status file.
     """
     prefix_dir = STATUS_DIR / prefix
-    if not prefix_dir.exists():
+
+    try:
+        with os.scandir(prefix_dir) as entries:
+            paths = [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".status") and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
         return []
 
-    results = []
-    for status_file in prefix_dir.glob("*.status"):
-        data = read_status(status_file)
-        if data:
-            results.append((status_file, data))
+    # Overlap the reads when there are many files; for the usual handful a
+    # thread pool costs more than it saves
+    if len(paths) > _PARALLEL_READ_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=_PARALLEL_READ_WORKERS) as executor:
+            datas = list(executor.map(_load_status_file, paths))
+    else:
+        datas = [_load_status_file(path) for path in paths]
+
+    return [(Path(path), data) for path, data in zip(paths, datas) if data]
 
-    return results
+
+def _load_status_file(path: str) -> Any:
+    """Read and parse a status file found by a directory scan.
+
+    The scan already found the file, so this skips read_status()'s stat.
+
+    Args:
+        path: Path to the status file.
+
+    Returns:
+        The parsed data, or None if the file can't be read or parsed.
+    """
+    try:
+        with open(path, "rb") as f:
+            return from_json(f.read())
+    except (ValueError, OSError):
+        return None
@@ -0,0 +1,43 @@
+"""Tests for the interactive input handler.
+
+Test organization:
+- TestKeyBindings: Tests for InteractiveInput's custom key bindings
+"""
+
+from unittest.mock import Mock
+
+import pytest
+from prompt_toolkit.keys import Keys
+
+from softfoundry.utils.interactive import InteractiveInput
+
+# -----------------------------------------------------------------------------
+# TestKeyBindings
+# -----------------------------------------------------------------------------
+
+
+class TestKeyBindings:
+    """Tests for InteractiveInput's custom key bindings."""
+
+    @pytest.mark.parametrize("multiline", [True, False])
+    def test_ctrl_c_calls_on_interrupt(self, multiline):
+        """Ctrl+C at the prompt is handed to the owner's callback."""
+        on_interrupt = Mock()
+        interactive = InteractiveInput(
+            on_input=Mock(), multiline=multiline, on_interrupt=on_interrupt
+        )
+
+        bindings = interactive._create_key_bindings()
+        matches = bindings.get_bindings_for_keys((Keys.ControlC,))
+
+        assert len(matches) == 1
+        matches[0].handler(Mock())
+        on_interrupt.assert_called_once_with()
+
+    def test_ctrl_c_unbound_without_on_interrupt(self):
+        """Without a callback, Ctrl+C keeps prompt_toolkit's default."""
+        interactive = InteractiveInput(on_input=Mock())
+
+        bindings = interactive._create_key_bindings()
+
+        assert bindings.get_bindings_for_keys((Keys.ControlC,)) == []
@@ -0,0 +1,389 @@
+"""Tests for the agent loop framework.
+
+Test organization:
+- TestQuestionPattern: Tests for QUESTION_RE (pure)
+- TestNeedsUserInput: Tests for Agent.needs_user_input() with the LLM stubbed
+- TestSessionResolution: Tests for session handling at the start of run()
+- TestRun: Tests for run() with a fake SDK client
+- TestStatusDebounce: Tests for debouncing of Agent status updates
+"""
+
+import asyncio
+import gc
+import weakref
+from collections.abc import Callable
+from unittest.mock import patch
+
+import pytest
+from claude_agent_sdk import ResultMessage
+
+from softfoundry.utils import status
+from softfoundry.utils.loop import (
+    QUESTION_RE,
+    STATUS_DEBOUNCE_INTERVAL,
+    Agent,
+    AgentConfig,
+)
+from softfoundry.utils.sessions import SessionManager
+
+
+class DummyAgent(Agent):
+    """Minimal agent implementing the abstract methods."""
+
+    def get_system_prompt(self) -> str:
+        return "You are a test agent."
+
+    def get_initial_prompt(self) -> str:
+        return "Start."
+
+    def is_complete(self, result) -> bool:
+        return True
+
+    def get_continuation_prompt(self) -> str:
+        return "Continue."
+
+
+class FakeInteractiveInput:
+    """Stand-in for InteractiveInput that never reads the terminal."""
+
+    def __init__(self, on_input, prompt="> ", on_interrupt=None):
+        self.status = "idle"
+        self.on_interrupt = on_interrupt
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    async def run(self) -> None:
+        await asyncio.Event().wait()
+
+    def enable(self) -> None:
+        pass
+
+    def disable(self, message: str = "") -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+
+class FakeClient:
+    """Stand-in for ClaudeSDKClient that completes every turn at once."""
+
+    def __init__(self, options=None):
+        self.queries: list[str] = []
+        self.on_query: Callable[[], None] | None = None
+        self.interrupted = False
+        self.connect_task: asyncio.Task | None = None
+        self.disconnect_task: asyncio.Task | None = None
+
+    async def connect(self) -> None:
+        self.connect_task = asyncio.current_task()
+
+    async def disconnect(self) -> None:
+        self.disconnect_task = asyncio.current_task()
+
+    async def query(self, prompt: str) -> None:
+        self.queries.append(prompt)
+        if self.on_query is not None:
+            self.on_query()
+
+    async def interrupt(self) -> None:
+        self.interrupted = True
+
+    async def receive_response(self):
+        yield ResultMessage(
+            subtype="success",
+            duration_ms=1,
+            duration_api_ms=1,
+            is_error=False,
+            num_turns=1,
+            session_id="session-1",
+            total_cost_usd=0.01,
+            result="DONE",
+        )
+
+
+# -----------------------------------------------------------------------------
+# Fixtures
+# -----------------------------------------------------------------------------
+
+
+@pytest.fixture
+def status_dir(tmp_path, monkeypatch):
+    """Keep status files in a temporary directory."""
+    monkeypatch.setattr(status, "STATUS_DIR", tmp_path)
+    status._READ_CACHE.clear()
+    yield tmp_path
+    status._READ_CACHE.clear()
+
+
+@pytest.fixture
+def agent(status_dir):
+    """An agent that has just written its "starting" status."""
+    agent = DummyAgent(AgentConfig(namespace="test", agent_type="worker"))
+    agent.update_status("starting", "Initializing agent")
+    return agent
+
+
+def status_on_disk(agent: Agent) -> str:
+    """Read the agent's status straight from its file."""
+    status._READ_CACHE.clear()
+    data = agent.read_status()
+    assert data is not None
+    return data["status"]
+
+
+async def wait_for_deferred_flush(agent: Agent) -> None:
+    """Let a deferred status write fire and finish."""
+    await asyncio.sleep(STATUS_DEBOUNCE_INTERVAL * 2)
+    await agent._drain_background_tasks()
+
+
+# -----------------------------------------------------------------------------
+# TestQuestionPattern
+# -----------------------------------------------------------------------------
+
+
+class TestQuestionPattern:
+    """Tests for QUESTION_RE (pure)."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Should I proceed with option A?",
+            "Which branch should I use?\n",
+            "Tests pass. Please confirm the release version.",
+            "The token is missing. Please provide a GitHub token:",
+        ],
+    )
+    def test_final_sentence_request_matches(self, text):
+        """A question or request in the final sentence matches."""
+        assert QUESTION_RE.search(text)
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            (
+                "Which sub-issues are still open? Let me check the epic.\n"
+                "All 5 sub-issues are created and assigned."
+            ),
+            "Should I split this PR? No, it's small enough. Merging now.",
+            "Please confirm.\nConfirmed by the reviewer, continuing.",
+            "The reviewer asked to please clarify the docstring. Done.",
+        ],
+    )
+    def test_earlier_request_does_not_match(self, text):
+        """A question or request before the final sentence doesn't match."""
+        assert not QUESTION_RE.search(text)
+
+
+# -----------------------------------------------------------------------------
+# TestNeedsUserInput
+# -----------------------------------------------------------------------------
+
+
+class TestNeedsUserInput:
+    """Tests for Agent.needs_user_input() with the LLM stubbed."""
+
+    @pytest.fixture
+    def classify(self):
+        """Stub the memoized LLM classifier and record its calls."""
+        with patch(
+            "softfoundry.utils.loop._needs_user_input_cached", return_value=False
+        ) as classify:
+            yield classify
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Should I proceed with option A?",
+            "I need more details on the auth flow. Please clarify the token format.",
+            "Tests pass. Please confirm the release version.",
+        ],
+    )
+    def test_final_request_skips_llm(self, agent, classify, text):
+        """A request in the final sentence needs input without an LLM call."""
+        assert agent.needs_user_input(text)
+        classify.assert_not_called()
+
+    def test_plain_statement_skips_llm(self, agent, classify):
+        """Text with no question or request phrase doesn't need input."""
+        assert not agent.needs_user_input("All 5 sub-issues are created.")
+        classify.assert_not_called()
+
+    def test_ambiguous_text_asks_llm(self, agent, classify):
+        """A question earlier in the text is left to the LLM."""
+        text = "Which sub-issues are still open? Let me check.\nAll are created."
+
+        assert not agent.needs_user_input(text)
+        classify.assert_called_once_with(text)
+
+
+# -----------------------------------------------------------------------------
+# TestSessionResolution
+# -----------------------------------------------------------------------------
+
+
+class TestSessionResolution:
+    """Tests for session handling at the start of run()."""
+
+    def test_init_writes_no_status(self, status_dir):
+        """Creating an agent doesn't touch its status file."""
+        agent = DummyAgent(AgentConfig(namespace="test", agent_type="worker"))
+
+        assert agent.read_status() is None
+
+    async def test_missing_resume_session_writes_no_status(self, status_dir):
+        """Failing to resolve the session leaves no status file behind."""
+        agent = DummyAgent(
+            AgentConfig(namespace="test", agent_type="worker", resume=True)
+        )
+
+        with (
+            patch("sys.stdin.isatty", return_value=True),
+            patch.object(agent._session_manager, "get_session", return_value=None),
+            pytest.raises(ValueError, match="No existing session"),
+        ):
+            await agent.run()
+
+        assert agent.read_status() is None
+
+
+# -----------------------------------------------------------------------------
+# TestRun
+# -----------------------------------------------------------------------------
+
+
+class TestRun:
+    """Tests for run() with a fake SDK client."""
+
+    @pytest.fixture
+    def fake_client(self, status_dir):
+        """Patch run()'s collaborators and return the client it will use."""
+        client = FakeClient()
+        with (
+            patch("sys.stdin.isatty", return_value=True),
+            patch("claude_agent_sdk.ClaudeSDKClient", return_value=client),
+            patch("softfoundry.utils.loop.get_claude_code_token", return_value=""),
+            patch("softfoundry.utils.loop.InteractiveInput", FakeInteractiveInput),
+            patch.object(SessionManager, "get_session", return_value=None),
+            patch.object(Agent, "_save_session"),
+        ):
+            yield client
+
+    async def test_connects_and_disconnects_in_same_task(self, fake_client):
+        """connect() and disconnect() run in run()'s own task."""
+        agent = DummyAgent(AgentConfig(namespace="test", agent_type="worker"))
+
+        await agent.run()
+
+        assert fake_client.connect_task is asyncio.current_task()
+        assert fake_client.disconnect_task is asyncio.current_task()
+        assert fake_client.queries == ["Start."]
+        assert status_on_disk(agent) == "exited:success"
+
+    async def test_ctrl_c_while_sending_interrupts_turn(self, fake_client):
+        """A Ctrl+C during query() interrupts the turn once it starts."""
+        agent = DummyAgent(AgentConfig(namespace="test", agent_type="worker"))
+        fake_client.on_query = agent._on_sigint
+
+        with pytest.raises(SystemExit):
+            await agent.run()
+
+        assert fake_client.interrupted
+        assert status_on_disk(agent) == "exited:terminated"
+
+    def test_second_ctrl_c_writes_terminated_status(self, agent):
+        """Forcing an exit still records the final status."""
+        agent._on_sigint()
+
+        with pytest.raises(KeyboardInterrupt):
+            agent._on_sigint()
+
+        assert status_on_disk(agent) == "exited:terminated"
+
+
+# -----------------------------------------------------------------------------
+# TestStatusDebounce
+# -----------------------------------------------------------------------------
+
+
+class TestStatusDebounce:
+    """Tests for debouncing of Agent status updates."""
+
+    async def test_rapid_update_is_deferred(self, agent):
+        """An update right after a write is held back, then flushed."""
+        agent.update_status("working", "Implementing issue #3")
+
+        assert status_on_disk(agent) == "starting"
+
+        await wait_for_deferred_flush(agent)
+
+        assert status_on_disk(agent) == "working"
+
+    async def test_exited_is_written_immediately(self, agent):
+        """A final status is written at once, even within the interval."""
+        agent.update_status("working", "Implementing issue #3")
+        agent.update_status("exited:success", "Completed successfully")
+
+        assert status_on_disk(agent) == "exited:success"
+
+    async def test_exited_is_not_replaced_by_deferred_update(self, agent):
+        """A deferred update pending before the final status is discarded."""
+        agent.update_status("working", "Implementing issue #3")
+        agent.update_status("exited:terminated", "User interrupted")
+
+        await wait_for_deferred_flush(agent)
+
+        assert status_on_disk(agent) == "exited:terminated"
+
+    async def test_exited_is_not_replaced_by_late_worker_write(self, agent):
+        """A worker-thread write that finishes after the final status is skipped."""
+        payload = {"status": "working", "details": ""}
+        seq = agent._begin_status_write()
+        agent.update_status("exited:error", "Error: boom")
+
+        await asyncio.to_thread(agent._write_status_file, payload, seq)
+
+        assert status_on_disk(agent) == "exited:error"
+
+    async def test_async_exited_is_written(self, agent):
+        """aupdate_status() writes a final status within the interval too."""
+        await agent.aupdate_status("working", "Implementing issue #3")
+        await agent.aupdate_status("exited:success", "Completed successfully")
+
+        await wait_for_deferred_flush(agent)
+
+        assert status_on_disk(agent) == "exited:success"
+
+    async def test_heartbeat_writes_pending_update(self, agent):
+        """A heartbeat during the debounce interval writes the held-back update."""
+        agent.update_status("working", "issue 1")
+        agent.update_status("working", "issue 2 PR #9")
+        agent._last_heartbeat = 0.0
+
+        await agent._maybe_heartbeat()
+        await wait_for_deferred_flush(agent)
+
+        status._READ_CACHE.clear()
+        assert agent.read_status()["details"] == "issue 2 PR #9"
+
+    def test_exited_without_event_loop(self, agent):
+        """Without an event loop, updates are written directly."""
+        agent.update_status("working", "Implementing issue #3")
+        assert status_on_disk(agent) == "working"
+
+        agent.update_status("exited:success", "Completed successfully")
+        assert status_on_disk(agent) == "exited:success"
+
+    def test_exit_flush_does_not_keep_agent_alive(self, status_dir):
+        """The atexit flush doesn't hold a reference to the agent."""
+        agent = DummyAgent(AgentConfig(namespace="test", agent_type="worker"))
+        ref = weakref.ref(agent)
+        del agent
+        gc.collect()
+
+        assert ref() is None
@@ -0,0 +1,158 @@
+"""Tests for agent status file management.
+
+Test organization:
+- TestReadCache: Tests for read_status() caching of parsed files
+- TestWrites: Tests for how update_status() writes the status file
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from softfoundry.utils import status
+from softfoundry.utils.status import read_status, update_status
+
+# -----------------------------------------------------------------------------
+# Fixtures
+# -----------------------------------------------------------------------------
+
+
+@pytest.fixture
+def status_path(tmp_path: Path):
+    """Path to a status file in a temporary directory, with a clean cache."""
+    status._READ_CACHE.clear()
+    yield tmp_path / "programmer-alice.status"
+    status._READ_CACHE.clear()
+
+
+# -----------------------------------------------------------------------------
+# TestReadCache
+# -----------------------------------------------------------------------------
+
+
+class TestReadCache:
+    """Tests for read_status() caching of parsed files."""
+
+    def test_read_after_write_is_cached(self, status_path):
+        """Reading back our own write doesn't parse the file."""
+        update_status(status_path, "working", "Implementing issue #3")
+
+        with patch.object(status, "from_json", wraps=status.from_json) as parse:
+            data = read_status(status_path)
+
+        parse.assert_not_called()
+        assert data is not None
+        assert data["status"] == "working"
+        assert data["details"] == "Implementing issue #3"
+
+    def test_repeated_reads_parse_once(self, status_path):
+        """An unchanged file is only parsed on the first read."""
+        status_path.write_text('{"status": "idle", "details": ""}')
+
+        with patch.object(status, "from_json", wraps=status.from_json) as parse:
+            first = read_status(status_path)
+            second = read_status(status_path)
+
+        assert parse.call_count == 1
+        assert first == second == {"status": "idle", "details": ""}
+
+    def test_cached_data_is_not_shared(self, status_path):
+        """Mutating a returned dict doesn't change later reads."""
+        update_status(status_path, "working")
+
+        read_status(status_path)["status"] = "mutated"
+
+        assert read_status(status_path)["status"] == "working"
+
+    def test_external_rewrite_is_picked_up(self, status_path):
+        """A write by someone else (e.g., an agent's Bash) invalidates the cache."""
+        update_status(status_path, "working", "Implementing issue #3")
+        read_status(status_path)
+
+        # Coarse filesystem timestamps could give the rewrite the same mtime;
+        # bump it so the generation is guaranteed to change
+        status_path.write_text('{"status": "exited:success", "details": "Done"}')
+        st = os.stat(status_path)
+        os.utime(status_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        data = read_status(status_path)
+
+        assert data == {"status": "exited:success", "details": "Done"}
+        assert status.is_agent_exited(status_path)
+
+    def test_missing_file_drops_cache_entry(self, status_path):
+        """A deleted file reads as None and is evicted from the cache."""
+        update_status(status_path, "working")
+        status_path.unlink()
+
+        assert read_status(status_path) is None
+        assert os.fspath(status_path) not in status._READ_CACHE
+
+
+# -----------------------------------------------------------------------------
+# TestWrites
+# -----------------------------------------------------------------------------
+
+
+class TestWrites:
+    """Tests for how update_status() writes the status file."""
+
+    def test_first_write_creates_file_directly(self, status_path):
+        """The first write creates the file in place, without a temp file."""
+        with patch.object(status.os, "replace", wraps=os.replace) as replace:
+            update_status(status_path, "starting", "Initializing agent")
+
+        replace.assert_not_called()
+        data = read_status(status_path)
+        assert data is not None
+        assert data["status"] == "starting"
+        assert data["started_at"] == data["last_update"]
+
+    def test_overwrite_replaces_via_temp_file(self, status_path):
+        """Later writes go through a temp file that replaces the original."""
+        update_status(status_path, "starting", "Initializing agent")
+        started_at = read_status(status_path)["started_at"]
+
+        with patch.object(status.os, "replace", wraps=os.replace) as replace:
+            update_status(status_path, "working", "Implementing issue #3")
+
+        replace.assert_called_once()
+        temp_path, target = replace.call_args.args
+        assert Path(temp_path).suffix == ".tmp"
+        assert Path(target) == status_path
+        assert sorted(p.name for p in status_path.parent.iterdir()) == [
+            status_path.name
+        ]
+
+        status._READ_CACHE.clear()
+        data = read_status(status_path)
+        assert data["status"] == "working"
+        assert data["started_at"] == started_at
+
+    def test_failed_overwrite_removes_temp_file(self, status_path):
+        """A failed replace leaves the original file and no temp file."""
+        update_status(status_path, "working")
+
+        with (
+            patch.object(status.os, "replace", side_effect=OSError("boom")),
+            pytest.raises(OSError),
+        ):
+            update_status(status_path, "idle")
+
+        assert sorted(p.name for p in status_path.parent.iterdir()) == [
+            status_path.name
+        ]
+        assert read_status(status_path)["status"] == "working"
+
+    def test_cache_matches_written_file(self, status_path):
+        """The cached generation is the one of the file on disk."""
+        update_status(status_path, "working")
+        update_status(status_path, "idle")
+
+        st = os.stat(status_path)
+        generation, data = status._READ_CACHE[os.fspath(status_path)]
+
+        assert generation == (st.st_mtime_ns, st.st_size)
+        assert data["status"] == "idle"